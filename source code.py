@@ -1,10 +1,30 @@
 
+import atexit
 import datetime
 import json
+import math
+import re
+import sys
+import time
+from array import array
 from dataclasses import dataclass
 from typing import List, Dict
 from enum import Enum
 
+# orjson (optional, much faster JSON) is imported lazily on the first
+# save/load so it doesn't slow down CLI start-up when it's installed.
+_orjson = False
+
+def _get_orjson():
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = None
+    return _orjson
+
 # Simple data models
 class Category(Enum):
     TUITION = "Tuition"
@@ -15,27 +35,79 @@ class Category(Enum):
     FUN = "Fun"
     OTHER = "Other"
 
-@dataclass
+# Computed once - no scanning/rebuilding the Enum on every lookup
+CATEGORIES = tuple(Category)
+_CATEGORY_BY_VALUE = {c.value: c for c in Category}
+_CAT_INDEX = {c: i for i, c in enumerate(CATEGORIES)}
+
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+def _valid_date(date_str):
+    """Cheap YYYY-MM-DD check - strptime is ~10x slower just to test format"""
+    m = _DATE_RE.match(date_str)
+    if not m:
+        return False
+    month, day = int(m.group(2)), int(m.group(3))
+    return 1 <= month <= 12 and 1 <= day <= 31
+
+_today_cache = (0, "")
+
+def _today():
+    """Today as YYYY-MM-DD, cached per second so we skip strftime per row"""
+    global _today_cache
+    now = int(time.time())
+    if now != _today_cache[0]:
+        d = datetime.date.today()
+        _today_cache = (now, f"{d.year:04d}-{d.month:02d}-{d.day:02d}")
+    return _today_cache[1]
+
+@dataclass(slots=True)
 class Transaction:
     amount: float
     category: Category
     description: str
     date: str = None
-    
+    month: str = None  # YYYY-MM, derived from date once
+
     def __post_init__(self):
         if not self.date:
-            self.date = datetime.datetime.now().strftime("%Y-%m-%d")
+            self.date = _today()
+        self.month = self.date[:7]
 
 # Main finance manager - keeping it simple!
 class StudentFinanceManager:
-    def __init__(self, data_file='student_finance.json'):
+    def __init__(self, data_file='student_finance.json', pretty=False):
         self.data_file = data_file
+        self.pretty = pretty  # indented JSON is ~2x the bytes, off by default
+        self.log_file = data_file + '.log'
+        self._log_fp = None
         self.transactions: List[Transaction] = []
         self.monthly_budget = 0
+        # Running totals so reports don't have to re-scan every transaction.
+        # Amounts also live in a packed float column - summing that is a
+        # C-level loop over plain doubles, no object hopping.
+        self._amounts = array('d')
+        # Only 7 categories, so a fixed list of buckets beats a dict
+        self._by_category = [0.0] * len(CATEGORIES)
+        self._by_month: Dict[str, float] = {}
         self.load_data()
-    
+        # Make sure buffered log lines hit disk however we exit
+        atexit.register(self.flush)
+
+    def flush(self):
+        """Push any buffered log lines out to disk"""
+        if self._log_fp:
+            self._log_fp.flush()
+
+    def _track(self, transaction: Transaction):
+        """Fold one transaction into the running totals"""
+        self._amounts.append(transaction.amount)
+        self._by_category[_CAT_INDEX[transaction.category]] += transaction.amount
+        month = transaction.month
+        self._by_month[month] = self._by_month.get(month, 0) + transaction.amount
+
     def save_data(self):
-        """Save all data to file"""
+        """Save all data to file (and empty the append log - it's folded in now)"""
         data = {
             'transactions': [
                 {
@@ -47,18 +119,52 @@ class StudentFinanceManager:
             ],
             'monthly_budget': self.monthly_budget
         }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+        # Encode once and write once - json.dump streams lots of tiny writes
+        orjson = _get_orjson()
+        if orjson:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2) if self.pretty \
+                else orjson.dumps(data)
+        elif self.pretty:
+            payload = json.dumps(data, indent=2).encode()
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+        with open(self.data_file, 'wb') as f:
+            f.write(payload)
+        self._truncate_log()
+
+    def compact(self):
+        """Fold the append log back into the main JSON file"""
+        self.save_data()
+
+    def _truncate_log(self):
+        if self._log_fp:
+            self._log_fp.close()
+            self._log_fp = None
+        open(self.log_file, 'w').close()
+
+    def _append_log(self, transaction: Transaction):
+        """Log one new transaction instead of rewriting the whole file"""
+        if self._log_fp is None:
+            self._log_fp = open(self.log_file, 'a', buffering=1 << 16)
+        self._log_fp.write(json.dumps({
+            'amount': transaction.amount,
+            'category': transaction.category.value,
+            'description': transaction.description,
+            'date': transaction.date
+        }, separators=(",", ":")) + "\n")
+
     def load_data(self):
         """Load data from file"""
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            # One big read, then parse - quicker than letting json stream the file
+            with open(self.data_file, 'rb') as f:
+                buf = f.read()
+                orjson = _get_orjson()
+                data = orjson.loads(buf) if orjson else json.loads(buf)
                 self.transactions = [
                     Transaction(
                         amount=t['amount'],
-                        category=Category(t['category']),
+                        category=_CATEGORY_BY_VALUE[t['category']],
                         description=t['description'],
                         date=t['date']
                     ) for t in data.get('transactions', [])
@@ -66,38 +172,75 @@ class StudentFinanceManager:
                 self.monthly_budget = data.get('monthly_budget', 0)
         except FileNotFoundError:
             self.transactions = []
-    
-    def add_spending(self, amount: float, category: Category, description: str = "") -> str:
+        # Replay anything added since the last full save
+        try:
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    t = json.loads(line)
+                    self.transactions.append(Transaction(
+                        amount=t['amount'],
+                        category=_CATEGORY_BY_VALUE[t['category']],
+                        description=t['description'],
+                        date=t['date']
+                    ))
+        except FileNotFoundError:
+            pass
+        self._rebuild_totals()
+
+    def _rebuild_totals(self):
+        """Rebuild all running totals in one fused pass (the hot part of loading)"""
+        amounts = array('d')
+        by_category = [0.0] * len(CATEGORIES)
+        by_month = {}
+        add_amount = amounts.append
+        cat_index = _CAT_INDEX
+        for t in self.transactions:
+            amount = t.amount
+            add_amount(amount)
+            by_category[cat_index[t.category]] += amount
+            month = t.month
+            by_month[month] = by_month.get(month, 0) + amount
+        self._amounts = amounts
+        self._by_category = by_category
+        self._by_month = by_month
+
+    def add_spending(self, amount: float, category: Category, description: str = "",
+                     date: str = None) -> str:
         """Add new spending with validation"""
         if amount <= 0:
             return "Error: Amount should be positive!"
-        
+
         if amount > 100000:
             return "Error: That's too much money for one transaction!"
-        
-        transaction = Transaction(amount, category, description)
+
+        if date and not _valid_date(date):
+            return "Error: Date should look like YYYY-MM-DD!"
+
+        transaction = Transaction(amount, category, description, date)
         self.transactions.append(transaction)
-        self.save_data()
-        
+        self._track(transaction)
+        self._append_log(transaction)
+
         return f"Added Rs.{amount} for {category.value} - {description}"
     
+    def predict_monthly_spending(self) -> float:
+        """Expected monthly spend - average over the running per-month totals"""
+        if not self._by_month:
+            return 0.0
+        return math.fsum(self._by_month.values()) / len(self._by_month)
+
     def get_spending_summary(self) -> Dict:
         """Get simple spending overview"""
-        total_spent = sum(t.amount for t in self.transactions)
-        
-        # Spending by category
-        category_totals = {}
-        for t in self.transactions:
-            category_totals[t.category.value] = category_totals.get(t.category.value, 0) + t.amount
-        
-        # Monthly prediction (simple average of last 3 months)
-        monthly_data = {}
-        for t in self.transactions:
-            month = t.date[:7]  # YYYY-MM
-            monthly_data[month] = monthly_data.get(month, 0) + t.amount
-        
-        avg_monthly = sum(monthly_data.values()) / len(monthly_data) if monthly_data else 0
-        
+        # All maintained incrementally by _track - no re-scan needed
+        total_spent = math.fsum(self._amounts)  # exact even over years of rows
+        category_totals = {
+            c.value: self._by_category[i]
+            for i, c in enumerate(CATEGORIES) if self._by_category[i]
+        }
+        avg_monthly = self.predict_monthly_spending()
+
         return {
             'total_spent': total_spent,
             'transaction_count': len(self.transactions),
@@ -117,7 +260,10 @@ class StudentFinanceManager:
         
         if summary['by_category']:
             print("\nWhere your money went:")
-            for category, amount in summary['by_category'].items():
+            # Biggest spenders first; plain sorted is right for 7 categories
+            ranked = sorted(summary['by_category'].items(),
+                            key=lambda kv: kv[1], reverse=True)
+            for category, amount in ranked:
                 percentage = (amount / summary['total_spent']) * 100
                 print(f"  {category}: Rs.{amount:.2f} ({percentage:.1f}%)")
         
@@ -130,9 +276,14 @@ class StudentFinanceManager:
             print(f"Monthly average: Rs.{summary['avg_monthly']:.2f}")
 
 # Simple menu-driven app
+_ROW_FMT = "  Rs.{:.2f} | {:10} | {} | {}\n".format  # parsed once, reused per row
+
 def run_finance_app():
-    manager = StudentFinanceManager()
-    
+    # --pretty keeps the data file human-readable at the cost of size/speed
+    manager = StudentFinanceManager(pretty='--pretty' in sys.argv)
+    category_menu = "Categories: " + " | ".join(
+        f"{i+1}.{cat.value}" for i, cat in enumerate(CATEGORIES))
+
     print("STUDENT FINANCE HELPER")
     print("=" * 30)
     
@@ -148,15 +299,15 @@ def run_finance_app():
         
         if choice == '1':
             print("\nAdd New Spending")
-            print("Categories: " + " | ".join(f"{i+1}.{cat.value}" for i, cat in enumerate(Category)))
-            
+            print(category_menu)
+
             try:
                 cat_choice = int(input("Category (1-7): ")) - 1
-                if 0 <= cat_choice < len(list(Category)):
+                if 0 <= cat_choice < len(CATEGORIES):
                     amount = float(input("Amount Rs.: "))
                     desc = input("What was this for? ")
-                    
-                    category = list(Category)[cat_choice]
+
+                    category = CATEGORIES[cat_choice]
                     result = manager.add_spending(amount, category, desc)
                     print(result)
                 else:
@@ -182,16 +333,21 @@ def run_finance_app():
                 print("\nNo transactions yet. Start adding your spending!")
             else:
                 print(f"\nLast {len(transactions)} transactions:")
-                for t in transactions:
-                    print(f"  Rs.{t.amount:.2f} | {t.category.value:10} | {t.description} | {t.date}")
+                sys.stdout.write("".join(
+                    _ROW_FMT(t.amount, t.category.value, t.description, t.date)
+                    for t in transactions))
         
         elif choice == '5':
+            manager.compact()
             print("\nGoodbye! Keep tracking your money!")
             break
         
         else:
             print("Error: Please choose 1-5")
 
+        # One flush per menu cycle keeps the log durable without per-add syscalls
+        manager.flush()
+
 if __name__ == "__main__":
     run_finance_app()
 